@@ -17,6 +17,9 @@ const (
 	defaultProgram = "claude"
 )
 
+// aliasRegex extracts the target path from shell alias output such as "claude: aliased to /path/to/claude".
+var aliasRegex = regexp.MustCompile(`(?:aliased to|->|=)\s*([^\s]+)`)
+
 // GetConfigDir returns the path to the application's configuration directory
 func GetConfigDir() (string, error) {
 	homeDir, err := os.UserHomeDir()
@@ -134,7 +137,6 @@ func GetClaudeCommand() (string, error) {
 		if path != "" {
 			// Check if the output is an alias definition and extract the actual path
 			// Handle formats like "claude: aliased to /path/to/claude" or other shell-specific formats
-			aliasRegex := regexp.MustCompile(`(?:aliased to|->|=)\s*([^\s]+)`)
 			matches := aliasRegex.FindStringSubmatch(path)
 			if len(matches) > 1 {
 				path = matches[1]
@@ -266,6 +266,25 @@ func TestGetProfiles(t *testing.T) {
 		assert.Equal(t, "claude", profiles[0].Name)
 		assert.Equal(t, "aider", profiles[1].Name)
 	})
+
+	t.Run("default in the middle moves first and drops duplicates", func(t *testing.T) {
+		cfg := &Config{
+			DefaultProgram: "aider",
+			Profiles: []Profile{
+				{Name: "claude", Program: "/usr/local/bin/claude"},
+				{Name: "gemini", Program: "gemini"},
+				{Name: "aider", Program: "aider --model gemma"},
+				{Name: "codex", Program: "codex"},
+				{Name: "aider", Program: "aider --model other"},
+			},
+		}
+		profiles := cfg.GetProfiles()
+		assert.Len(t, profiles, 4)
+		assert.Equal(t, "aider --model gemma", profiles[0].Program)
+		assert.Equal(t, "claude", profiles[1].Name)
+		assert.Equal(t, "gemini", profiles[2].Name)
+		assert.Equal(t, "codex", profiles[3].Name)
+	})
 }
 
 func TestSaveConfig(t *testing.T) {
@@ -98,7 +98,9 @@ func SaveState(state *State) error {
 	}
 
 	statePath := filepath.Join(configDir, StateFileName)
-	data, err := json.MarshalIndent(state, "", "  ")
+	// The state embeds every instance's full diff, so skip indentation: re-indenting the raw
+	// instance JSON walks all of it again on every save.
+	data, err := json.Marshal(state)
 	if err != nil {
 		return fmt.Errorf("failed to marshal state: %w", err)
 	}
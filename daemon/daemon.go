@@ -9,6 +9,8 @@ import (
 	"os/exec"
 	"os/signal"
 	"path/filepath"
+	"strconv"
+	"strings"
 	"sync"
 	"syscall"
 	"time"
@@ -45,17 +47,28 @@ func RunDaemon(cfg *config.Config) error {
 		defer wg.Done()
 		ticker := time.NewTimer(pollInterval)
 		for {
-			for _, instance := range instances {
+			// Each instance has its own tmux session and worktree, so poll them in parallel. Errors are
+			// collected and logged afterwards since everyN is not safe for concurrent use.
+			errs := make([]error, len(instances))
+			var pollWg sync.WaitGroup
+			for idx, inst := range instances {
 				// We only store started instances, but check anyway.
-				if instance.Started() && !instance.Paused() {
+				if !inst.Started() || inst.Paused() {
+					continue
+				}
+				pollWg.Add(1)
+				go func(i int, instance *session.Instance) {
+					defer pollWg.Done()
 					if _, hasPrompt := instance.HasUpdated(); hasPrompt {
 						instance.TapEnter()
-						if err := instance.UpdateDiffStats(); err != nil {
-							if everyN.ShouldLog() {
-								log.WarningLog.Printf("could not update diff stats for %s: %v", instance.Title, err)
-							}
-						}
+						errs[i] = instance.UpdateDiffStats()
 					}
+				}(idx, inst)
+			}
+			pollWg.Wait()
+			for i, err := range errs {
+				if err != nil && everyN.ShouldLog() {
+					log.WarningLog.Printf("could not update diff stats for %s: %v", instances[i].Title, err)
 				}
 			}
 
@@ -118,7 +131,7 @@ func LaunchDaemon() error {
 	}
 
 	pidFile := filepath.Join(pidDir, "daemon.pid")
-	if err := os.WriteFile(pidFile, []byte(fmt.Sprintf("%d", cmd.Process.Pid)), 0644); err != nil {
+	if err := os.WriteFile(pidFile, []byte(strconv.Itoa(cmd.Process.Pid)), 0644); err != nil {
 		return fmt.Errorf("failed to write PID file: %w", err)
 	}
 
@@ -143,8 +156,8 @@ func StopDaemon() error {
 		return fmt.Errorf("failed to read PID file: %w", err)
 	}
 
-	var pid int
-	if _, err := fmt.Sscanf(string(data), "%d", &pid); err != nil {
+	pid, err := strconv.Atoi(strings.TrimSpace(string(data)))
+	if err != nil {
 		return fmt.Errorf("invalid PID file format: %w", err)
 	}
 
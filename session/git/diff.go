@@ -37,15 +37,35 @@ func (g *GitWorktree) Diff() *DiffStats {
 		stats.Error = err
 		return stats
 	}
-	lines := strings.Split(content, "\n")
-	for _, line := range lines {
-		if strings.HasPrefix(line, "+") && !strings.HasPrefix(line, "+++") {
-			stats.Added++
-		} else if strings.HasPrefix(line, "-") && !strings.HasPrefix(line, "---") {
-			stats.Removed++
-		}
-	}
+	stats.Added, stats.Removed = countDiffLines(content)
 	stats.Content = content
 
 	return stats
 }
+
+// countDiffLines counts added and removed lines in a unified diff, ignoring the +++/--- file
+// headers. It walks the content in place instead of splitting it, since diffs can be large.
+func countDiffLines(content string) (added, removed int) {
+	for len(content) > 0 {
+		line := content
+		if i := strings.IndexByte(content, '\n'); i >= 0 {
+			line, content = content[:i], content[i+1:]
+		} else {
+			content = ""
+		}
+		if line == "" {
+			continue
+		}
+		switch line[0] {
+		case '+':
+			if !strings.HasPrefix(line, "+++") {
+				added++
+			}
+		case '-':
+			if !strings.HasPrefix(line, "---") {
+				removed++
+			}
+		}
+	}
+	return added, removed
+}
@@ -0,0 +1,52 @@
+package git
+
+import (
+	"testing"
+)
+
+func TestCountDiffLines(t *testing.T) {
+	tests := []struct {
+		name            string
+		input           string
+		expectedAdded   int
+		expectedRemoved int
+	}{
+		{
+			name:  "empty diff",
+			input: "",
+		},
+		{
+			name: "headers are not counted",
+			input: "diff --git a/main.go b/main.go\n" +
+				"--- a/main.go\n" +
+				"+++ b/main.go\n" +
+				"@@ -1,2 +1,3 @@\n" +
+				" package main\n" +
+				"-var a = 1\n" +
+				"+var a = 2\n" +
+				"+var b = 3\n",
+			expectedAdded:   2,
+			expectedRemoved: 1,
+		},
+		{
+			name:            "no trailing newline",
+			input:           "+added\n-removed",
+			expectedAdded:   1,
+			expectedRemoved: 1,
+		},
+		{
+			name:  "blank lines",
+			input: "\n\n \n",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			added, removed := countDiffLines(tt.input)
+			if added != tt.expectedAdded || removed != tt.expectedRemoved {
+				t.Errorf("countDiffLines(%q) = (%d, %d), want (%d, %d)",
+					tt.input, added, removed, tt.expectedAdded, tt.expectedRemoved)
+			}
+		})
+	}
+}
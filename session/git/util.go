@@ -7,6 +7,13 @@ import (
 	"strings"
 )
 
+var (
+	// unsafeBranchCharsRegex matches characters outside the safe subset allowed in branch names.
+	unsafeBranchCharsRegex = regexp.MustCompile(`[^a-z0-9\-_/.]+`)
+	// repeatedDashRegex matches runs of dashes.
+	repeatedDashRegex = regexp.MustCompile(`-+`)
+)
+
 // sanitizeBranchName transforms an arbitrary string into a Git branch name friendly string.
 // Note: Git branch names have several rules, so this function uses a simple approach
 // by allowing only a safe subset of characters.
@@ -19,12 +26,10 @@ func sanitizeBranchName(s string) string {
 
 	// Remove any characters not allowed in our safe subset.
 	// Here we allow: letters, digits, dash, underscore, slash, and dot.
-	re := regexp.MustCompile(`[^a-z0-9\-_/.]+`)
-	s = re.ReplaceAllString(s, "")
+	s = unsafeBranchCharsRegex.ReplaceAllString(s, "")
 
 	// Replace multiple dashes with a single dash (optional cleanup)
-	reDash := regexp.MustCompile(`-+`)
-	s = reDash.ReplaceAllString(s, "-")
+	s = repeatedDashRegex.ReplaceAllString(s, "-")
 
 	// Trim leading and trailing dashes or slashes to avoid issues
 	s = strings.Trim(s, "-/")
@@ -175,10 +175,9 @@ func CleanupWorktrees() error {
 	currentWorktree := ""
 	lines := strings.Split(string(output), "\n")
 	for _, line := range lines {
-		if strings.HasPrefix(line, "worktree ") {
-			currentWorktree = strings.TrimPrefix(line, "worktree ")
-		} else if strings.HasPrefix(line, "branch ") {
-			branchPath := strings.TrimPrefix(line, "branch ")
+		if worktree, ok := strings.CutPrefix(line, "worktree "); ok {
+			currentWorktree = worktree
+		} else if branchPath, ok := strings.CutPrefix(line, "branch "); ok {
 			// Extract branch name from refs/heads/branch-name
 			branchName := strings.TrimPrefix(branchPath, "refs/heads/")
 			if currentWorktree != "" {
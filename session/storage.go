@@ -56,29 +56,21 @@ func NewStorage(state config.InstanceStorage) (*Storage, error) {
 // SaveInstances saves the list of instances to disk
 func (s *Storage) SaveInstances(instances []*Instance) error {
 	// Convert instances to InstanceData
-	data := make([]InstanceData, 0)
+	data := make([]InstanceData, 0, len(instances))
 	for _, instance := range instances {
 		if instance.Started() {
 			data = append(data, instance.ToInstanceData())
 		}
 	}
 
-	// Marshal to JSON
-	jsonData, err := json.Marshal(data)
-	if err != nil {
-		return fmt.Errorf("failed to marshal instances: %w", err)
-	}
-
-	return s.state.SaveInstances(jsonData)
+	return s.saveInstancesData(data)
 }
 
 // LoadInstances loads the list of instances from disk
 func (s *Storage) LoadInstances() ([]*Instance, error) {
-	jsonData := s.state.GetInstances()
-
-	var instancesData []InstanceData
-	if err := json.Unmarshal(jsonData, &instancesData); err != nil {
-		return nil, fmt.Errorf("failed to unmarshal instances: %w", err)
+	instancesData, err := s.loadInstancesData()
+	if err != nil {
+		return nil, err
 	}
 
 	instances := make([]*Instance, len(instancesData))
@@ -95,17 +87,16 @@ func (s *Storage) LoadInstances() ([]*Instance, error) {
 
 // DeleteInstance removes an instance from storage
 func (s *Storage) DeleteInstance(title string) error {
-	instances, err := s.LoadInstances()
+	instancesData, err := s.loadInstancesData()
 	if err != nil {
 		return fmt.Errorf("failed to load instances: %w", err)
 	}
 
 	found := false
-	newInstances := make([]*Instance, 0)
-	for _, instance := range instances {
-		data := instance.ToInstanceData()
+	newInstancesData := make([]InstanceData, 0, len(instancesData))
+	for _, data := range instancesData {
 		if data.Title != title {
-			newInstances = append(newInstances, instance)
+			newInstancesData = append(newInstancesData, data)
 		} else {
 			found = true
 		}
@@ -115,22 +106,21 @@ func (s *Storage) DeleteInstance(title string) error {
 		return fmt.Errorf("instance not found: %s", title)
 	}
 
-	return s.SaveInstances(newInstances)
+	return s.saveInstancesData(newInstancesData)
 }
 
 // UpdateInstance updates an existing instance in storage
 func (s *Storage) UpdateInstance(instance *Instance) error {
-	instances, err := s.LoadInstances()
+	instancesData, err := s.loadInstancesData()
 	if err != nil {
 		return fmt.Errorf("failed to load instances: %w", err)
 	}
 
 	data := instance.ToInstanceData()
 	found := false
-	for i, existing := range instances {
-		existingData := existing.ToInstanceData()
-		if existingData.Title == data.Title {
-			instances[i] = instance
+	for i, existing := range instancesData {
+		if existing.Title == data.Title {
+			instancesData[i] = data
 			found = true
 			break
 		}
@@ -140,7 +130,30 @@ func (s *Storage) UpdateInstance(instance *Instance) error {
 		return fmt.Errorf("instance not found: %s", data.Title)
 	}
 
-	return s.SaveInstances(instances)
+	return s.saveInstancesData(instancesData)
+}
+
+// loadInstancesData loads the serialized instances without restoring them. Restoring an
+// instance reattaches to its tmux session, which callers that only edit the stored list
+// don't need.
+func (s *Storage) loadInstancesData() ([]InstanceData, error) {
+	jsonData := s.state.GetInstances()
+
+	var instancesData []InstanceData
+	if err := json.Unmarshal(jsonData, &instancesData); err != nil {
+		return nil, fmt.Errorf("failed to unmarshal instances: %w", err)
+	}
+	return instancesData, nil
+}
+
+// saveInstancesData marshals the serialized instances and saves them to disk.
+func (s *Storage) saveInstancesData(instancesData []InstanceData) error {
+	jsonData, err := json.Marshal(instancesData)
+	if err != nil {
+		return fmt.Errorf("failed to marshal instances: %w", err)
+	}
+
+	return s.state.SaveInstances(jsonData)
 }
 
 // DeleteAllInstances removes all stored instances
@@ -0,0 +1,79 @@
+package session
+
+import (
+	"encoding/json"
+	"testing"
+
+	"github.com/stretchr/testify/require"
+)
+
+// memoryStorage is an in-memory config.InstanceStorage.
+type memoryStorage struct {
+	data json.RawMessage
+}
+
+func (m *memoryStorage) SaveInstances(instancesJSON json.RawMessage) error {
+	m.data = instancesJSON
+	return nil
+}
+
+func (m *memoryStorage) GetInstances() json.RawMessage {
+	return m.data
+}
+
+func (m *memoryStorage) DeleteAllInstances() error {
+	m.data = json.RawMessage("[]")
+	return nil
+}
+
+func newTestStorage(t *testing.T, titles ...string) (*Storage, *memoryStorage) {
+	t.Helper()
+	data := make([]InstanceData, 0, len(titles))
+	for _, title := range titles {
+		data = append(data, InstanceData{Title: title, Status: Paused, Program: "claude"})
+	}
+	raw, err := json.Marshal(data)
+	require.NoError(t, err)
+
+	state := &memoryStorage{data: raw}
+	storage, err := NewStorage(state)
+	require.NoError(t, err)
+	return storage, state
+}
+
+func storedTitles(t *testing.T, state *memoryStorage) []string {
+	t.Helper()
+	var data []InstanceData
+	require.NoError(t, json.Unmarshal(state.data, &data))
+	titles := make([]string, 0, len(data))
+	for _, d := range data {
+		titles = append(titles, d.Title)
+	}
+	return titles
+}
+
+func TestStorageDeleteInstance(t *testing.T) {
+	storage, state := newTestStorage(t, "one", "two", "three")
+
+	require.NoError(t, storage.DeleteInstance("two"))
+	require.Equal(t, []string{"one", "three"}, storedTitles(t, state))
+
+	require.Error(t, storage.DeleteInstance("missing"))
+	require.Equal(t, []string{"one", "three"}, storedTitles(t, state))
+}
+
+func TestStorageUpdateInstance(t *testing.T) {
+	storage, state := newTestStorage(t, "one", "two")
+
+	instance := &Instance{Title: "two", Branch: "feature", Status: Paused, Program: "aider"}
+	require.NoError(t, storage.UpdateInstance(instance))
+
+	var data []InstanceData
+	require.NoError(t, json.Unmarshal(state.data, &data))
+	require.Len(t, data, 2)
+	require.Equal(t, "one", data[0].Title)
+	require.Equal(t, "feature", data[1].Branch)
+	require.Equal(t, "aider", data[1].Program)
+
+	require.Error(t, storage.UpdateInstance(&Instance{Title: "missing"}))
+}
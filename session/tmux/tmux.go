@@ -1,13 +1,12 @@
 package tmux
 
 import (
-	"bytes"
 	"claude-squad/cmd"
 	"claude-squad/log"
 	"context"
-	"crypto/sha256"
 	"errors"
 	"fmt"
+	"hash/maphash"
 	"io"
 	"os"
 	"os/exec"
@@ -31,6 +30,9 @@ type TmuxSession struct {
 	// The name of the tmux session and the sanitized name used for tmux commands.
 	sanitizedName string
 	program       string
+	// promptMarker is the text that indicates program is waiting on a prompt. Empty if we don't
+	// detect prompts for program.
+	promptMarker string
 	// ptyFactory is used to create a PTY for the tmux session.
 	ptyFactory PtyFactory
 	// cmdExec is used to execute commands in the tmux session.
@@ -55,16 +57,39 @@ type TmuxSession struct {
 	ctx    context.Context
 	cancel func()
 	wg     *sync.WaitGroup
+
+	// captureMu guards the cached pane capture below. Captures are requested both from the UI
+	// goroutine (preview) and from background goroutines (status monitoring).
+	captureMu sync.Mutex
+	// captured is the most recent pane capture and capturedAt is when it was taken. A capture
+	// younger than captureTTL is reused instead of spawning another tmux process.
+	captured   string
+	capturedAt time.Time
 }
 
 const TmuxPrefix = "claudesquad_"
 
-var whiteSpaceRegex = regexp.MustCompile(`\s+`)
+// captureTTL is how long a pane capture is reused. The preview and status monitor ticks often
+// capture the same pane back to back, so they can share one capture-pane call.
+const captureTTL = 50 * time.Millisecond
+
+// sessionNameRegex matches claude squad session names in `tmux ls` output.
+var sessionNameRegex = regexp.MustCompile(TmuxPrefix + `.*:`)
 
 func toClaudeSquadTmuxName(str string) string {
-	str = whiteSpaceRegex.ReplaceAllString(str, "")
-	str = strings.ReplaceAll(str, ".", "_") // tmux replaces all . with _
-	return fmt.Sprintf("%s%s", TmuxPrefix, str)
+	// Sanitize in a single pass: drop whitespace (the same set as the regexp \s class) and
+	// replace all . and : with _. tmux does the same when creating the session, and both are
+	// target separators, so leaving them in would make -t address the wrong (or no) session.
+	str = strings.Map(func(r rune) rune {
+		switch r {
+		case ' ', '\t', '\n', '\f', '\r':
+			return -1
+		case '.', ':':
+			return '_'
+		}
+		return r
+	}, str)
+	return TmuxPrefix + str
 }
 
 // NewTmuxSession creates a new TmuxSession with the given name and program.
@@ -81,11 +106,26 @@ func newTmuxSession(name string, program string, ptyFactory PtyFactory, cmdExec
 	return &TmuxSession{
 		sanitizedName: toClaudeSquadTmuxName(name),
 		program:       program,
+		promptMarker:  promptMarkerFor(program),
 		ptyFactory:    ptyFactory,
 		cmdExec:       cmdExec,
 	}
 }
 
+// promptMarkerFor returns the text to look for in the pane to detect a prompt. Only claude, aider
+// and gemini are supported. The program never changes for a session, so this is resolved once.
+func promptMarkerFor(program string) string {
+	switch {
+	case program == ProgramClaude:
+		return "No, and tell Claude what to do differently"
+	case strings.HasPrefix(program, ProgramAider):
+		return "(Y)es/(N)o/(D)on't ask again"
+	case strings.HasPrefix(program, ProgramGemini):
+		return "Yes, allow once"
+	}
+	return ""
+}
+
 // Start creates and starts a new tmux session, then attaches to it. Program is the command to run in
 // the session (ex. claude). workdir is the git worktree directory.
 func (t *TmuxSession) Start(workDir string) error {
@@ -187,29 +227,38 @@ func (t *TmuxSession) Restore() error {
 	}
 	t.ptmx = ptmx
 	t.monitor = newStatusMonitor()
+	t.invalidateCapture()
 	return nil
 }
 
 type statusMonitor struct {
-	// Store hashes to save memory.
-	prevOutputHash []byte
+	// Store hashes to save memory. The hash only has to detect changes within this process, so a
+	// seeded 64-bit maphash is enough; it needs no cryptographic strength.
+	seed           maphash.Seed
+	prevOutputHash uint64
+	// Whether the content with prevOutputHash had a prompt. Reused while the content is unchanged.
+	prevHasPrompt bool
 }
 
 func newStatusMonitor() *statusMonitor {
-	return &statusMonitor{}
+	return &statusMonitor{seed: maphash.MakeSeed()}
 }
 
 // hash hashes the string.
-func (m *statusMonitor) hash(s string) []byte {
-	h := sha256.New()
-	// TODO: this allocation sucks since the string is probably large. Ideally, we hash the string directly.
-	h.Write([]byte(s))
-	return h.Sum(nil)
+func (m *statusMonitor) hash(s string) uint64 {
+	return maphash.String(m.seed, s)
 }
 
+// Keystroke byte sequences written to the PTY. They never change, so they are allocated once.
+var (
+	enterKey     = []byte{0x0D}
+	dAndEnterKey = []byte{0x44, 0x0D}
+)
+
 // TapEnter sends an enter keystroke to the tmux pane.
 func (t *TmuxSession) TapEnter() error {
-	_, err := t.ptmx.Write([]byte{0x0D})
+	t.invalidateCapture()
+	_, err := t.ptmx.Write(enterKey)
 	if err != nil {
 		return fmt.Errorf("error sending enter keystroke to PTY: %w", err)
 	}
@@ -218,7 +267,8 @@ func (t *TmuxSession) TapEnter() error {
 
 // TapDAndEnter sends 'D' followed by an enter keystroke to the tmux pane.
 func (t *TmuxSession) TapDAndEnter() error {
-	_, err := t.ptmx.Write([]byte{0x44, 0x0D})
+	t.invalidateCapture()
+	_, err := t.ptmx.Write(dAndEnterKey)
 	if err != nil {
 		return fmt.Errorf("error sending enter keystroke to PTY: %w", err)
 	}
@@ -226,6 +276,7 @@ func (t *TmuxSession) TapDAndEnter() error {
 }
 
 func (t *TmuxSession) SendKeys(keys string) error {
+	t.invalidateCapture()
 	_, err := t.ptmx.Write([]byte(keys))
 	return err
 }
@@ -239,20 +290,18 @@ func (t *TmuxSession) HasUpdated() (updated bool, hasPrompt bool) {
 		return false, false
 	}
 
-	// Only set hasPrompt for claude and aider. Use these strings to check for a prompt.
-	if t.program == ProgramClaude {
-		hasPrompt = strings.Contains(content, "No, and tell Claude what to do differently")
-	} else if strings.HasPrefix(t.program, ProgramAider) {
-		hasPrompt = strings.Contains(content, "(Y)es/(N)o/(D)on't ask again")
-	} else if strings.HasPrefix(t.program, ProgramGemini) {
-		hasPrompt = strings.Contains(content, "Yes, allow once")
+	h := t.monitor.hash(content)
+	if h == t.monitor.prevOutputHash {
+		// Same content as last tick, so the prompt check would give the same answer.
+		return false, t.monitor.prevHasPrompt
 	}
 
-	if !bytes.Equal(t.monitor.hash(content), t.monitor.prevOutputHash) {
-		t.monitor.prevOutputHash = t.monitor.hash(content)
-		return true, hasPrompt
-	}
-	return false, hasPrompt
+	// Only set hasPrompt for programs with a known prompt marker.
+	hasPrompt = t.promptMarker != "" && strings.Contains(content, t.promptMarker)
+
+	t.monitor.prevOutputHash = h
+	t.monitor.prevHasPrompt = hasPrompt
+	return true, hasPrompt
 }
 
 func (t *TmuxSession) Attach() (chan struct{}, error) {
@@ -461,15 +510,33 @@ func (t *TmuxSession) DoesSessionExist() bool {
 	return t.cmdExec.Run(existsCmd) == nil
 }
 
-// CapturePaneContent captures the content of the tmux pane
+// CapturePaneContent captures the content of the tmux pane. A capture taken within the last
+// captureTTL is returned as is.
 func (t *TmuxSession) CapturePaneContent() (string, error) {
+	t.captureMu.Lock()
+	defer t.captureMu.Unlock()
+	if !t.capturedAt.IsZero() && time.Since(t.capturedAt) < captureTTL {
+		return t.captured, nil
+	}
+
 	// Add -e flag to preserve escape sequences (ANSI color codes)
 	cmd := exec.Command("tmux", "capture-pane", "-p", "-e", "-J", "-t", t.sanitizedName)
 	output, err := t.cmdExec.Output(cmd)
 	if err != nil {
 		return "", fmt.Errorf("error capturing pane content: %v", err)
 	}
-	return string(output), nil
+	t.captured = string(output)
+	t.capturedAt = time.Now()
+	return t.captured, nil
+}
+
+// invalidateCapture drops the cached pane capture so that the next capture reflects any input
+// we have just sent.
+func (t *TmuxSession) invalidateCapture() {
+	t.captureMu.Lock()
+	t.captured = ""
+	t.capturedAt = time.Time{}
+	t.captureMu.Unlock()
 }
 
 // CapturePaneContentWithOptions captures the pane content with additional options
@@ -499,8 +566,7 @@ func CleanupSessions(cmdExec cmd.Executor) error {
 		return fmt.Errorf("failed to list tmux sessions: %v", err)
 	}
 
-	re := regexp.MustCompile(fmt.Sprintf(`%s.*:`, TmuxPrefix))
-	matches := re.FindAllString(string(output), -1)
+	matches := sessionNameRegex.FindAllString(string(output), -1)
 	for i, match := range matches {
 		matches[i] = match[:strings.Index(match, ":")]
 	}
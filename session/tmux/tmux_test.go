@@ -47,6 +47,12 @@ func TestSanitizeName(t *testing.T) {
 
 	session = NewTmuxSession("a sd f . . asdf", "program")
 	require.Equal(t, TmuxPrefix+"asdf__asdf", session.sanitizedName)
+
+	session = NewTmuxSession("fix\tthe\nbug.v2", "program")
+	require.Equal(t, TmuxPrefix+"fixthebug_v2", session.sanitizedName)
+
+	session = NewTmuxSession("feat:login", "program")
+	require.Equal(t, TmuxPrefix+"feat_login", session.sanitizedName)
 }
 
 func TestStartTmuxSession(t *testing.T) {
@@ -86,3 +92,85 @@ func TestStartTmuxSession(t *testing.T) {
 	_, err = ptyFactory.files[1].Stat()
 	require.NoError(t, err)
 }
+
+func TestCapturePaneContentReusesRecentCapture(t *testing.T) {
+	ptyFactory := NewMockPtyFactory(t)
+
+	captures := 0
+	cmdExec := cmd_test.MockCmdExec{
+		RunFunc: func(cmd *exec.Cmd) error {
+			return nil
+		},
+		OutputFunc: func(cmd *exec.Cmd) ([]byte, error) {
+			if strings.Contains(cmd.String(), "capture-pane") {
+				captures++
+			}
+			return []byte(fmt.Sprintf("output %d", captures)), nil
+		},
+	}
+
+	session := newTmuxSession("test-session", "claude", ptyFactory, cmdExec)
+	require.NoError(t, session.Restore())
+
+	content, err := session.CapturePaneContent()
+	require.NoError(t, err)
+	require.Equal(t, "output 1", content)
+
+	// A back to back capture reuses the previous one.
+	content, err = session.CapturePaneContent()
+	require.NoError(t, err)
+	require.Equal(t, "output 1", content)
+	require.Equal(t, 1, captures)
+
+	// Sending input invalidates the cached capture.
+	require.NoError(t, session.SendKeys("x"))
+	content, err = session.CapturePaneContent()
+	require.NoError(t, err)
+	require.Equal(t, "output 2", content)
+	require.Equal(t, 2, captures)
+}
+
+func TestHasUpdated(t *testing.T) {
+	ptyFactory := NewMockPtyFactory(t)
+
+	pane := "working"
+	cmdExec := cmd_test.MockCmdExec{
+		RunFunc: func(cmd *exec.Cmd) error {
+			return nil
+		},
+		OutputFunc: func(cmd *exec.Cmd) ([]byte, error) {
+			return []byte(pane), nil
+		},
+	}
+
+	session := newTmuxSession("test-session", "claude", ptyFactory, cmdExec)
+	require.NoError(t, session.Restore())
+
+	updated, hasPrompt := session.HasUpdated()
+	require.True(t, updated)
+	require.False(t, hasPrompt)
+
+	session.invalidateCapture()
+	updated, hasPrompt = session.HasUpdated()
+	require.False(t, updated)
+	require.False(t, hasPrompt)
+
+	pane = "No, and tell Claude what to do differently"
+	session.invalidateCapture()
+	updated, hasPrompt = session.HasUpdated()
+	require.True(t, updated)
+	require.True(t, hasPrompt)
+
+	// The prompt is still reported while the content is unchanged.
+	session.invalidateCapture()
+	updated, hasPrompt = session.HasUpdated()
+	require.False(t, updated)
+	require.True(t, hasPrompt)
+}
+
+func TestPromptMarkerFor(t *testing.T) {
+	require.Equal(t, "No, and tell Claude what to do differently", promptMarkerFor(ProgramClaude))
+	require.Equal(t, "(Y)es/(N)o/(D)on't ask again", promptMarkerFor("aider --model gemma"))
+	require.Equal(t, "Yes, allow once", promptMarkerFor(ProgramGemini))
+	require.Equal(t, "", promptMarkerFor("bash"))
+}
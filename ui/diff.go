@@ -21,6 +21,9 @@ type DiffPane struct {
 	stats    string
 	width    int
 	height   int
+	// rawDiff is the uncolored diff that diff was rendered from. SetDiff runs on every preview tick,
+	// so we only re-colorize when the content actually changes.
+	rawDiff string
 }
 
 func NewDiffPane() *DiffPane {
@@ -84,12 +87,16 @@ func (d *DiffPane) SetDiff(instance *session.Instance) {
 	if stats.IsEmpty() {
 		d.stats = ""
 		d.diff = ""
+		d.rawDiff = ""
 		d.viewport.SetContent(centeredFallbackMessage)
 	} else {
 		additions := AdditionStyle.Render(fmt.Sprintf("%d additions(+)", stats.Added))
 		deletions := DeletionStyle.Render(fmt.Sprintf("%d deletions(-)", stats.Removed))
 		d.stats = lipgloss.JoinHorizontal(lipgloss.Center, additions, " ", deletions)
-		d.diff = colorizeDiff(stats.Content)
+		if stats.Content != d.rawDiff {
+			d.diff = colorizeDiff(stats.Content)
+			d.rawDiff = stats.Content
+		}
 		d.viewport.SetContent(lipgloss.JoinVertical(lipgloss.Left, d.stats, d.diff))
 	}
 }
@@ -110,27 +117,33 @@ func (d *DiffPane) ScrollDown() {
 
 func colorizeDiff(diff string) string {
 	var coloredOutput strings.Builder
+	// Styling only adds bytes, so the raw diff size is a lower bound.
+	coloredOutput.Grow(len(diff))
 
-	lines := strings.Split(diff, "\n")
-	for _, line := range lines {
+	// Walk the lines in place rather than splitting the whole diff into a slice first.
+	for {
+		line, rest, more := strings.Cut(diff, "\n")
 		if len(line) > 0 {
 			if strings.HasPrefix(line, "@@") {
 				// Color hunk headers cyan
-				coloredOutput.WriteString(HunkStyle.Render(line) + "\n")
+				coloredOutput.WriteString(HunkStyle.Render(line))
 			} else if line[0] == '+' && (len(line) == 1 || line[1] != '+') {
 				// Color added lines green, excluding metadata like '+++'
-				coloredOutput.WriteString(AdditionStyle.Render(line) + "\n")
+				coloredOutput.WriteString(AdditionStyle.Render(line))
 			} else if line[0] == '-' && (len(line) == 1 || line[1] != '-') {
 				// Color removed lines red, excluding metadata like '---'
-				coloredOutput.WriteString(DeletionStyle.Render(line) + "\n")
+				coloredOutput.WriteString(DeletionStyle.Render(line))
 			} else {
 				// Print metadata and unchanged lines without color
-				coloredOutput.WriteString(line + "\n")
+				coloredOutput.WriteString(line)
 			}
-		} else {
-			// Preserve empty lines
-			coloredOutput.WriteString("\n")
 		}
+		// Every line, including empty ones, is terminated with a newline
+		coloredOutput.WriteByte('\n')
+		if !more {
+			break
+		}
+		diff = rest
 	}
 
 	return coloredOutput.String()
@@ -317,21 +317,21 @@ func (l *List) Up() {
 }
 
 func (l *List) addRepo(repo string) {
-	if _, ok := l.repos[repo]; !ok {
-		l.repos[repo] = 0
-	}
+	// A missing repo reads as 0, so a single increment both registers and counts it.
 	l.repos[repo]++
 }
 
 func (l *List) rmRepo(repo string) {
-	if _, ok := l.repos[repo]; !ok {
+	count, ok := l.repos[repo]
+	if !ok {
 		log.ErrorLog.Printf("repo %s not found", repo)
 		return
 	}
-	l.repos[repo]--
-	if l.repos[repo] == 0 {
+	if count <= 1 {
 		delete(l.repos, repo)
+		return
 	}
+	l.repos[repo] = count - 1
 }
 
 // AddInstance adds a new instance to the list. It returns a finalizer function that should be called when the instance
@@ -32,6 +32,17 @@ var verticalSeparator = " │ "
 var menuStyle = lipgloss.NewStyle().
 	Foreground(lipgloss.Color("205"))
 
+// menuGroups defines the group boundaries of the menu options. It is static, so it is built once
+// instead of on every render.
+var menuGroups = []struct {
+	start int
+	end   int
+}{
+	{0, 2}, // Instance management group (n, d)
+	{2, 5}, // Action group (enter, submit, pause/resume)
+	{6, 8}, // System group (tab, help, q)
+}
+
 // MenuState represents different states the menu can be in
 type MenuState int
 
@@ -162,16 +173,6 @@ func (m *Menu) SetSize(width, height int) {
 func (m *Menu) String() string {
 	var s strings.Builder
 
-	// Define group boundaries
-	groups := []struct {
-		start int
-		end   int
-	}{
-		{0, 2}, // Instance management group (n, d)
-		{2, 5}, // Action group (enter, submit, pause/resume)
-		{6, 8}, // System group (tab, help, q)
-	}
-
 	for i, k := range m.options {
 		binding := keys.GlobalkeyBindings[k]
 
@@ -193,7 +194,7 @@ func (m *Menu) String() string {
 			inActionGroup = i <= 1
 		default:
 			// For other states, the action group is the second group
-			inActionGroup = i >= groups[1].start && i < groups[1].end
+			inActionGroup = i >= menuGroups[1].start && i < menuGroups[1].end
 		}
 
 		if inActionGroup {
@@ -209,7 +210,7 @@ func (m *Menu) String() string {
 		// Add appropriate separator
 		if i != len(m.options)-1 {
 			isGroupEnd := false
-			for _, group := range groups {
+			for _, group := range menuGroups {
 				if i == group.end-1 {
 					s.WriteString(sepStyle.Render(verticalSeparator))
 					isGroupEnd = true
@@ -14,6 +14,18 @@ import (
 
 // Most of this code is modified from https://github.com/charmbracelet/lipgloss/pull/102
 
+// Regular expressions for ANSI color codes, used to fade the background.
+var (
+	// Match background color codes like \x1b[48;2;R;G;Bm or \x1b[48;5;Nm
+	bgColorRegex = regexp.MustCompile(`\x1b\[48;[25];[0-9;]+m`)
+
+	// Match foreground color codes like \x1b[38;2;R;G;Bm or \x1b[38;5;Nm
+	fgColorRegex = regexp.MustCompile(`\x1b\[38;[25];[0-9;]+m`)
+
+	// Match simple color codes like \x1b[31m
+	simpleColorRegex = regexp.MustCompile(`\x1b\[[0-9]+m`)
+)
+
 // WhitespaceOption sets a styling rule for rendering whitespace.
 type WhitespaceOption func(*whitespace)
 
@@ -60,17 +72,13 @@ func PlaceOverlay(
 	// Create a new array of background lines with the fade effect applied
 	fadedBgLines := make([]string, len(bgLines))
 
-	// Compile regular expressions for ANSI color codes
-	// Match background color codes like \x1b[48;2;R;G;Bm or \x1b[48;5;Nm
-	bgColorRegex := regexp.MustCompile(`\x1b\[48;[25];[0-9;]+m`)
-
-	// Match foreground color codes like \x1b[38;2;R;G;Bm or \x1b[38;5;Nm
-	fgColorRegex := regexp.MustCompile(`\x1b\[38;[25];[0-9;]+m`)
-
-	// Match simple color codes like \x1b[31m
-	simpleColorRegex := regexp.MustCompile(`\x1b\[[0-9]+m`)
-
 	for i, line := range bgLines {
+		// All color codes start with a CSI sequence; lines without one have nothing to fade.
+		if !strings.Contains(line, "\x1b[") {
+			fadedBgLines[i] = line
+			continue
+		}
+
 		// Replace background color codes with a faded version
 		content := bgColorRegex.ReplaceAllString(line, "\x1b[48;5;236m") // Dark gray background
 